@@ -23,7 +23,9 @@ model = dict(
         real_label_val=1.0,
         fake_label_val=0.0,
         loss_weight=1.0),
-    pixel_loss=dict(type='L1Loss', loss_weight=100.0, reduction='mean'))
+    pixel_loss=dict(type='L1Loss', loss_weight=100.0, reduction='mean'),
+    img_norm_cfg=dict(
+        mean=[127.5, 127.5, 127.5], std=[127.5, 127.5, 127.5], to_rgb=True))
 # model training and testing settings
 train_cfg = dict(direction='a2b')  # model default: a2b
 test_cfg = dict(direction='a2b', show_input=True)
@@ -31,7 +33,6 @@ test_cfg = dict(direction='a2b', show_input=True)
 # dataset settings
 train_dataset_type = 'GenerationPairedDataset'
 val_dataset_type = 'GenerationPairedDataset'
-img_norm_cfg = dict(mean=[0.5, 0.5, 0.5], std=[0.5, 0.5, 0.5])
 train_pipeline = [
     dict(
         type='LoadPairedImageFromFile',
@@ -45,11 +46,8 @@ train_pipeline = [
         interpolation='bicubic'),
     # dict(type='FixedCrop', keys=['img_a', 'img_b'], crop_size=(256, 256)),
     # dict(type='Flip', keys=['img_a', 'img_b'], direction='horizontal'),
-    dict(type='RescaleToZeroOne', keys=['img_a', 'img_b']),
-    dict(
-        type='Normalize', keys=['img_a', 'img_b'], to_rgb=True,
-        **img_norm_cfg),
-    dict(type='ImageToTensor', keys=['img_a', 'img_b']),
+    # images stay in uint8 and are normalized by the model on the device
+    dict(type='ImageToTensor', keys=['img_a', 'img_b'], to_float32=False),
     dict(
         type='Collect',
         keys=['img_a', 'img_b'],
@@ -60,17 +58,15 @@ test_pipeline = [
         type='LoadPairedImageFromFile',
         io_backend='disk',
         key='pair',
-        flag='color'),
+        flag='color',
+        use_cache=True),
     dict(
         type='Resize',
         keys=['img_a', 'img_b'],
         scale=(256, 256),
         interpolation='bicubic'),
-    dict(type='RescaleToZeroOne', keys=['img_a', 'img_b']),
-    dict(
-        type='Normalize', keys=['img_a', 'img_b'], to_rgb=True,
-        **img_norm_cfg),
-    dict(type='ImageToTensor', keys=['img_a', 'img_b']),
+    # images stay in uint8 and are normalized by the model on the device
+    dict(type='ImageToTensor', keys=['img_a', 'img_b'], to_float32=False),
     dict(
         type='Collect',
         keys=['img_a', 'img_b'],
@@ -79,8 +75,12 @@ test_pipeline = [
 data_root = 'data/paired/edges2shoes'
 data = dict(
     train_dataloader=dict(
-        samples_per_gpu=4, workers_per_gpu=4, drop_last=True),
-    val_dataloader=dict(samples_per_gpu=1, workers_per_gpu=4),
+        samples_per_gpu=4,
+        workers_per_gpu=4,
+        drop_last=True,
+        prefetch_factor=4),
+    val_dataloader=dict(
+        samples_per_gpu=1, workers_per_gpu=4, prefetch_factor=4),
     test_dataloader=dict(samples_per_gpu=1, workers_per_gpu=4),
     train=dict(
         type=train_dataset_type,
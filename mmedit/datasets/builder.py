@@ -90,6 +90,7 @@ def build_dataloader(dataset,
                      drop_last=False,
                      pin_memory=True,
                      persistent_workers=True,
+                     prefetch_factor=None,
                      **kwargs):
     """Build PyTorch DataLoader.
 
@@ -117,6 +118,10 @@ def build_dataloader(dataset,
             This allows to maintain the workers Dataset instances alive.
             The argument also has effect in PyTorch>=1.7.0.
             Default: True
+        prefetch_factor (int | None): Number of batches loaded in advance by
+            each worker. If None, the DataLoader default is used. The
+            argument only has effect in PyTorch>=1.7.0 and when
+            ``workers_per_gpu`` > 0. Default: None
         kwargs (dict, optional): Any keyword argument to be used to initialize
             DataLoader.
 
@@ -146,6 +151,8 @@ def build_dataloader(dataset,
 
     if version.parse(torch.__version__) >= version.parse('1.7.0'):
         kwargs['persistent_workers'] = persistent_workers
+        if prefetch_factor is not None and num_workers > 0:
+            kwargs['prefetch_factor'] = prefetch_factor
 
     data_loader = DataLoader(
         dataset,
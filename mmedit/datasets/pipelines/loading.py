@@ -512,6 +512,10 @@ class LoadPairedImageFromFile(LoadImageFromFile):
             Default: 'bgr'.
         save_original_img (bool): If True, maintain a copy of the image in
             `results` dict with name of `f'ori_{key}'`. Default: False.
+        use_cache (bool): If True, keep the decoded image pairs in memory
+            so that each file is read and decoded only once per worker.
+            Useful for small validation sets evaluated repeatedly with
+            persistent workers. Default: False.
         kwargs (dict): Args for file client.
     """
 
@@ -528,9 +532,15 @@ class LoadPairedImageFromFile(LoadImageFromFile):
         if self.file_client is None:
             self.file_client = FileClient(self.io_backend, **self.kwargs)
         filepath = str(results[f'{self.key}_path'])
-        img_bytes = self.file_client.get(filepath)
-        img = mmcv.imfrombytes(
-            img_bytes, flag=self.flag, channel_order=self.channel_order)  # HWC
+        if self.use_cache and filepath in self.cache:
+            img = self.cache[filepath]
+        else:
+            img_bytes = self.file_client.get(filepath)
+            img = mmcv.imfrombytes(
+                img_bytes, flag=self.flag,
+                channel_order=self.channel_order)  # HWC
+            if self.use_cache:
+                self.cache[filepath] = img
         if img.ndim == 2:
             img = np.expand_dims(img, axis=2)
 
@@ -40,6 +40,13 @@ class Pix2Pix(BaseModel):
             training direction, same as testing direction): a2b | b2a.
             `show_input`: whether to show input real images.
         pretrained (str): Path for pretrained model. Default: None.
+        img_norm_cfg (dict, optional): Config for normalizing the input
+            images on the model side, which allows the data pipeline to
+            keep images in uint8 until they reach the device. It contains
+            `mean` and `std` (in the input value range) and `to_rgb`
+            (whether to convert channels from BGR to RGB). If None, inputs
+            are assumed to be normalized by the data pipeline.
+            Default: None.
     """
 
     def __init__(self,
@@ -49,7 +56,8 @@ class Pix2Pix(BaseModel):
                  pixel_loss=None,
                  train_cfg=None,
                  test_cfg=None,
-                 pretrained=None):
+                 pretrained=None,
+                 img_norm_cfg=None):
         super().__init__()
 
         self.train_cfg = train_cfg
@@ -79,6 +87,11 @@ class Pix2Pix(BaseModel):
         self.show_input = (False if self.test_cfg is None else
                            self.test_cfg.get('show_input', False))
 
+        self.img_norm_cfg = img_norm_cfg
+        if self.img_norm_cfg is not None:
+            self.mean = torch.Tensor(img_norm_cfg['mean']).view(1, -1, 1, 1)
+            self.std = torch.Tensor(img_norm_cfg['std']).view(1, -1, 1, 1)
+
         # support fp16
         self.fp16_enabled = False
         self.init_weights(pretrained)
@@ -93,6 +106,23 @@ class Pix2Pix(BaseModel):
         self.generator.init_weights(pretrained=pretrained)
         self.discriminator.init_weights(pretrained=pretrained)
 
+    def normalize(self, img):
+        """Normalize input images on the device they were sent to.
+
+        Args:
+            img (Tensor): Input images with shape (n, c, h, w). It may be
+                of uint8 type.
+
+        Returns:
+            Tensor: Normalized float images.
+        """
+        img = img.float()
+        if self.img_norm_cfg.get('to_rgb', False):
+            img = img.flip(1)
+        self.mean = self.mean.to(img)
+        self.std = self.std.to(img)
+        return (img - self.mean) / self.std
+
     def setup(self, img_a, img_b, meta):
         """Perform necessary pre-processing steps.
 
@@ -217,6 +247,10 @@ class Pix2Pix(BaseModel):
             test_mode (bool): Whether in test mode or not. Default: False.
             kwargs (dict): Other arguments.
         """
+        if self.img_norm_cfg is not None:
+            img_a = self.normalize(img_a)
+            img_b = self.normalize(img_b)
+
         if test_mode:
             return self.forward_test(img_a, img_b, meta, **kwargs)
 
@@ -2,6 +2,7 @@
 import copy
 import os.path as osp
 from pathlib import Path
+from unittest.mock import patch
 
 import mmcv
 import numpy as np
@@ -418,6 +419,20 @@ class TestGenerationLoading:
         assert id(results['ori_img_b']) != id(results['img_b'])
         assert results['img_b_path'] == self.pair_path
 
+        # use_cache
+        config = dict(io_backend='disk', key='pair', use_cache=True)
+        load_paired_image_from_file = LoadPairedImageFromFile(**config)
+        assert not load_paired_image_from_file.cache
+        results = load_paired_image_from_file(copy.deepcopy(self.results))
+        assert self.pair_path in load_paired_image_from_file.cache
+        np.testing.assert_equal(results['pair'], self.pair_img)
+        with patch.object(load_paired_image_from_file.file_client,
+                          'get') as mock_get:
+            results = load_paired_image_from_file(copy.deepcopy(self.results))
+            mock_get.assert_not_called()
+        np.testing.assert_equal(results['img_a'], self.img_a)
+        np.testing.assert_equal(results['img_b'], self.img_b)
+
 
 def test_dct_mask():
     mask = np.zeros((64, 64, 1))
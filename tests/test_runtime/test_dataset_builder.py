@@ -1,6 +1,8 @@
 # Copyright (c) OpenMMLab. All rights reserved.
 import math
 
+import torch
+from mmcv.utils import digit_version
 from torch.utils.data import ConcatDataset, RandomSampler, SequentialSampler
 
 from mmedit.datasets import (DATASETS, RepeatDataset, build_dataloader,
@@ -138,3 +140,17 @@ def test_build_dataloader():
         math.ceil(len(dataset) / samples_per_gpu / 8))
     assert isinstance(dataloader.sampler, RandomSampler)
     assert dataloader.num_workers == 16
+
+    # prefetch_factor
+    dataloader = build_dataloader(
+        dataset, samples_per_gpu=3, workers_per_gpu=2, prefetch_factor=4)
+    if digit_version(torch.__version__) >= digit_version('1.7.0'):
+        assert dataloader.prefetch_factor == 4
+    # ignored without worker processes
+    dataloader = build_dataloader(
+        dataset,
+        samples_per_gpu=3,
+        workers_per_gpu=0,
+        persistent_workers=False,
+        prefetch_factor=4)
+    assert dataloader.num_workers == 0
@@ -402,3 +402,72 @@ def test_pix2pix():
         assert torch.is_tensor(outputs['fake_b'])
         assert outputs['fake_b'].size() == (1, 3, 256, 256)
         assert outputs['saved_flag']
+
+
+def test_pix2pix_img_norm_cfg():
+
+    model_cfg = dict(
+        type='Pix2Pix',
+        generator=dict(
+            type='UnetGenerator',
+            in_channels=3,
+            out_channels=3,
+            num_down=8,
+            base_channels=64,
+            norm_cfg=dict(type='BN'),
+            use_dropout=True,
+            init_cfg=dict(type='normal', gain=0.02)),
+        discriminator=dict(
+            type='PatchDiscriminator',
+            in_channels=6,
+            base_channels=64,
+            num_conv=3,
+            norm_cfg=dict(type='BN'),
+            init_cfg=dict(type='normal', gain=0.02)),
+        gan_loss=dict(
+            type='GANLoss',
+            gan_type='vanilla',
+            real_label_val=1.0,
+            fake_label_val=0,
+            loss_weight=1.0),
+        pixel_loss=dict(type='L1Loss', loss_weight=100.0, reduction='mean'),
+        img_norm_cfg=dict(
+            mean=[127.5, 127.5, 127.5], std=[127.5, 127.5, 127.5],
+            to_rgb=True))
+
+    synthesizer = build_model(model_cfg, train_cfg=None, test_cfg=None)
+
+    # uint8 inputs are normalized to [-1, 1] with BGR converted to RGB
+    inputs = torch.randint(0, 256, (1, 3, 256, 256), dtype=torch.uint8)
+    targets = torch.randint(0, 256, (1, 3, 256, 256), dtype=torch.uint8)
+    img_meta = dict(img_a_path='img_a_path', img_b_path='img_b_path')
+    data_batch = {'img_a': inputs, 'img_b': targets, 'meta': [img_meta]}
+    norm_inputs = (inputs.float().flip(1) - 127.5) / 127.5
+    norm_targets = (targets.float().flip(1) - 127.5) / 127.5
+
+    # val_step
+    with torch.no_grad():
+        outputs = synthesizer.val_step(data_batch)
+    assert torch.allclose(outputs['real_a'], norm_inputs)
+    assert torch.allclose(outputs['real_b'], norm_targets)
+    assert outputs['fake_b'].size() == (1, 3, 256, 256)
+
+    # train_step
+    optim_cfg = dict(type='Adam', lr=2e-4, betas=(0.5, 0.999))
+    optimizer = {
+        'generator':
+        obj_from_dict(
+            optim_cfg, torch.optim,
+            dict(params=getattr(synthesizer, 'generator').parameters())),
+        'discriminator':
+        obj_from_dict(
+            optim_cfg, torch.optim,
+            dict(params=getattr(synthesizer, 'discriminator').parameters()))
+    }
+    outputs = synthesizer.train_step(data_batch, optimizer)
+    for v in [
+            'loss_gan_d_fake', 'loss_gan_d_real', 'loss_gan_g', 'loss_pixel'
+    ]:
+        assert isinstance(outputs['log_vars'][v], float)
+    assert torch.allclose(outputs['results']['real_a'], norm_inputs)
+    assert torch.allclose(outputs['results']['real_b'], norm_targets)